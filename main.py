@@ -1,34 +1,53 @@
+import atexit
+import io
 import shutil
 import logging.config
 import os
 import re
+import threading
 import time
 import traceback
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime
+from pathlib import PurePosixPath
+from urllib.parse import urlparse
 
-import PyPDF2
+import pikepdf
+import pytesseract
 import requests
+from requests.adapters import HTTPAdapter
 from azure.cognitiveservices.vision.computervision import ComputerVisionClient
 from azure.cognitiveservices.vision.computervision.models import OperationStatusCodes
 from azure.storage.blob import BlobServiceClient
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from msrest.authentication import CognitiveServicesCredentials
+from PIL import Image
+from pytesseract import Output
 from pymongo import MongoClient
+from pymongo.write_concern import WriteConcern
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
+from tables import clean_header, process_table_data
+
 load_dotenv()
 
 # Setting up mongo db client
-client = MongoClient(os.getenv("MONGO_URI"))
-db = client[os.getenv("MONGO_DB_NAME")]
-collection = db[os.getenv("MONGO_COLLECTION_NAME")]
+mongo_client = MongoClient(os.getenv("MONGO_URI"), maxPoolSize=200, minPoolSize=10, maxIdleTimeMS=300000)
+db = mongo_client[os.getenv("MONGO_DB_NAME")]
+# Unacknowledged writes, this is a bulk ingest and inserts are batched below
+collection = db.get_collection(os.getenv("MONGO_COLLECTION_NAME"), write_concern=WriteConcern(w=0))
+
+# Buffered documents waiting to be flushed with insert_many
+MONGO_BATCH_SIZE = 500
+_mongo_buffer = []
+_mongo_buffer_lock = threading.Lock()
 
 # Azure cognitive service setup
 subscription_key = os.getenv("COMPUTER_VISION_CLIENT_SUBSCRIPTION_KEY")
@@ -36,6 +55,14 @@ endpoint = os.getenv("COMPUTER_VISION_CLIENT_ENDPOINT")
 
 client = ComputerVisionClient(endpoint, CognitiveServicesCredentials(subscription_key))
 
+# Azure blob storage setup
+blob_service_client = BlobServiceClient.from_connection_string(os.getenv("AZURE_CONNECTION_STRING"))
+container_client = blob_service_client.get_container_client(os.getenv("AZURE_CONTAINER_NAME"))
+
+# Pooled HTTP session for order PDF downloads, keeps connections to sci.gov.in alive across cases
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 ### Logger Setup
 LOG_DIR = "logs"
 logging.config.dictConfig(
@@ -71,9 +98,42 @@ logging.config.dictConfig(
 )
 logger = logging.getLogger("supremecourt")
 
+# Number of diary numbers scraped concurrently, each worker owns one persistent driver
+MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", 4))
+# Diary numbers submitted ahead of the oldest unfinished one
+MAX_IN_FLIGHT = int(os.getenv("SCRAPER_MAX_IN_FLIGHT", 16))
+# Times a diary number is re-submitted after a scrape failure before it is skipped
+MAX_CASE_RETRIES = int(os.getenv("SCRAPER_MAX_CASE_RETRIES", 2))
+
+# Per-thread Chrome driver, created lazily and reused across cases
+_driver_local = threading.local()
+
+# Expandable sections of the case details page, clicked open before the page is parsed
+CASE_DETAIL_TABLES = {
+    # table class: content inside the section that the extractors read, present once the section has loaded
+    "caseDetailsTable earlier_court_details no-responsive": "//tbody//table",
+    "caseDetailsTable listing_dates no-responsive": "//tbody//table",
+    "caseDetailsTable interlocutory_application_documents no-responsive": "//tbody//table",
+    "caseDetailsTable notices no-responsive": "//tbody//table",
+    "caseDetailsTable defects no-responsive": "//tbody//table",
+    "caseDetailsTable mention_memo no-responsive": "//tbody//table",
+    "caseDetailsTable office_report no-responsive": "//tbody//table",
+    "caseDetailsTable tagged_matters no-responsive": "//tbody//table",
+    "caseDetailsTable judgement_orders no-responsive": "//tbody//tr//a",
+}
+
+# C-backed lxml parser for BeautifulSoup, much faster than the pure python html.parser
+HTML_PARSER = "lxml"
+
+# Captcha is a single "a+b" / "a-b" integer expression
+_RE_CAPTCHA_EXPRESSION = re.compile(r"^\d+\s*[+-]\s*\d+$")
+TESSERACT_CAPTCHA_CONFIG = "--psm 7 -c tessedit_char_whitelist=0123456789+-"
+# Minimum per-token tesseract confidence (0-100) to trust the local read over Azure
+TESSERACT_MIN_CONFIDENCE = 80
+
 
 def process_case_details_by_diary_number(diary_number: str, year: str):
-    driver = get_headless_driver()
+    driver = get_thread_driver()
     wait = WebDriverWait(driver, 10)
     try:
         driver.get("https://www.sci.gov.in/case-status-diary-no/")
@@ -89,12 +149,11 @@ def process_case_details_by_diary_number(diary_number: str, year: str):
 
         return data
     finally:
-        driver.quit()
-        pass
+        reset_thread_driver()
 
 
 def process_case_details_by_case_number(case_type: str, case_no: str, year: str):
-    driver = get_headless_driver()
+    driver = get_thread_driver()
     wait = WebDriverWait(driver, 10)
     try:
 
@@ -115,8 +174,7 @@ def process_case_details_by_case_number(case_type: str, case_no: str, year: str)
 
         return data
     finally:
-        driver.quit()
-        pass
+        reset_thread_driver()
 
 
 def get_headless_driver():
@@ -125,48 +183,88 @@ def get_headless_driver():
         options.add_argument("--disable-gpu")
         options.add_argument("--no-sandbox")
         options.add_argument("--window-size=1920x1080")
+        options.add_argument("--disable-dev-shm-usage")
+        # Images stay enabled, the CAPTCHA is an image on the same site and has to render for OCR
+        options.add_experimental_option("prefs", {"profile.default_content_setting_values.notifications": 2})
+        # Return from driver.get on DOMContentLoaded, every element used afterwards is waited on explicitly
+        options.page_load_strategy = "eager"
         options.add_argument(
             "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36"
         )
+        # Run the browser on a Selenium Grid when one is configured, locally otherwise
+        remote_webdriver = os.getenv("REMOTE_WEBDRIVER")
+        if remote_webdriver:
+            return webdriver.Remote(command_executor=remote_webdriver, options=options)
         return webdriver.Chrome(options=options)
     except Exception as e:
         logger.error(f"Error in getting headless_driver: {e}")
         raise Exception(f"Error in getting headless_driver: {e}")
 
 
+def get_thread_driver():
+    driver = getattr(_driver_local, "driver", None)
+    if driver is None:
+        driver = get_headless_driver()
+        _driver_local.driver = driver
+        atexit.register(driver.quit)
+    return driver
+
+
+def reset_thread_driver():
+    driver = getattr(_driver_local, "driver", None)
+    if driver is None:
+        return
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception as e:
+        # Driver is unusable (crashed/disconnected), drop it so the next case starts a fresh one
+        logger.error(f"Error in resetting driver, discarding it: {e}")
+        _driver_local.driver = None
+        atexit.unregister(driver.quit)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
 def retry_captcha_process(
     driver: webdriver.Chrome,
     wait: WebDriverWait,
-    attempt: int = 0,
     max_attempts: int = 20,
 ):
     try:
-        if attempt >= max_attempts:
-            logger.error("Max CAPTCHA attempts reached. Exiting process.")
-            raise Exception("Max CAPTCHA attempts reached. Please try again.")
-
-        time.sleep(2)
-        captcha_image_element = wait.until(EC.presence_of_element_located((By.ID, "siwp_captcha_image_0")))
-
-        captcha_image_path = f"{uuid.uuid4().hex}.png"
-        time.sleep(2)
-        captcha_image_element.screenshot(captcha_image_path)
-
-        extracted_text = extract_text_from_image(captcha_image_path)
-        result = solve_expression(extracted_text)
-        logger.info(result)
-
-        # Delete the CAPTCHA image after extracting text
-        if os.path.exists(captcha_image_path):
-            os.remove(captcha_image_path)
-            logger.info(f"Captcha image {captcha_image_path} deleted.")
-
-        if isinstance(result, str) and result.startswith("Error evaluating expression"):
-            logger.error("Failed to parse expression. Retrying CAPTCHA process...")
-            refresh_link = driver.find_element(By.CLASS_NAME, "captcha-refresh-btn")
-            refresh_link.click()
-            retry_captcha_process(driver, wait, attempt + 1)
-        else:
+        previous_captcha_src = None
+        use_local_ocr = True
+        for attempt in range(max_attempts):
+            if previous_captcha_src is not None:
+                # The refresh may swap the src asynchronously, wait for the new captcha before reading it
+                wait.until(
+                    lambda d: d.find_element(By.ID, "siwp_captcha_image_0").get_attribute("src")
+                    != previous_captcha_src
+                )
+            captcha_image_element = wait.until(EC.presence_of_element_located((By.ID, "siwp_captcha_image_0")))
+            wait.until(
+                lambda d: d.execute_script(
+                    "return arguments[0].complete && arguments[0].naturalWidth > 0;", captcha_image_element
+                )
+            )
+
+            captcha_image = preprocess_captcha(captcha_image_element.screenshot_as_png)
+
+            extracted_text = extract_text_locally(captcha_image) if use_local_ocr else None
+            if not extracted_text:
+                extracted_text = extract_text_from_image(captcha_image)
+            result = solve_expression(extracted_text)
+            logger.info(result)
+
+            if isinstance(result, str) and result.startswith("Error evaluating expression"):
+                logger.error(f"Failed to parse expression on attempt {attempt + 1}. Retrying CAPTCHA process...")
+                previous_captcha_src = captcha_image_element.get_attribute("src")
+                refresh_link = driver.find_element(By.CLASS_NAME, "captcha-refresh-btn")
+                refresh_link.click()
+                continue
+
             captcha_input_field = wait.until(EC.presence_of_element_located((By.ID, "siwp_captcha_value_0")))
             captcha_input_field.clear()
 
@@ -177,41 +275,91 @@ def retry_captcha_process(
             submit_button.click()
 
             try:
-                try:
-                    WebDriverWait(driver, 3).until(
-                        EC.visibility_of_element_located(By.XPATH, "//div[@class='notfound']")
+                # Whichever shows up first, the not found notice or the results table
+                outcome = WebDriverWait(driver, 10).until(
+                    EC.any_of(
+                        EC.visibility_of_element_located((By.XPATH, "//div[@class='notfound']")),
+                        EC.presence_of_element_located((By.CLASS_NAME, "distTableContent")),
                     )
-                    return False
-                except Exception as e:
-                    pass
-
-                dist_table_content = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "distTableContent"))
                 )
+            except TimeoutException:
+                # Neither showed up so the answer was rejected, most likely a misread, retry on Azure OCR
+                logger.error(f"CAPTCHA answer rejected on attempt {attempt + 1}. Retrying CAPTCHA process...")
+                use_local_ocr = False
+                captcha_image_element = driver.find_element(By.ID, "siwp_captcha_image_0")
+                previous_captcha_src = captcha_image_element.get_attribute("src")
+                refresh_link = driver.find_element(By.CLASS_NAME, "captcha-refresh-btn")
+                refresh_link.click()
+                continue
 
-                table_element = dist_table_content.find_element(By.XPATH, ".//table")
+            try:
+                if "notfound" in outcome.get_attribute("class"):
+                    return False
+
+                table_element = outcome.find_element(By.XPATH, ".//table")
                 return process_table(driver, table_element)
             except Exception as e:
                 logger.error(f"Error after form submission: {str(e)}")
+                return None
+
+        logger.error("Max CAPTCHA attempts reached. Exiting process.")
+        raise Exception("Max CAPTCHA attempts reached. Please try again.")
 
     except Exception as e:
         logger.error(f"Error in retry_captcha_process: {str(e)}")
         traceback.print_exc()
 
 
-def extract_text_from_image(image_path: str):
+def preprocess_captcha(image: bytes):
+    # Grayscale and binarize the captcha, smaller upload and cleaner digits for OCR
     try:
-        with open(image_path, "rb") as image_data:
-            read_response = client.read_in_stream(image_data, raw=True)
+        with Image.open(io.BytesIO(image)) as img:
+            binarized = img.convert("L").point(lambda p: 255 if p >= 128 else 0, mode="1")
+            output = io.BytesIO()
+            binarized.save(output, format="PNG", optimize=True)
+            return output.getvalue()
+    except Exception as e:
+        logger.error(f"Error preprocessing captcha image, using original: {e}")
+        return image
+
+
+def extract_text_locally(image: bytes):
+    # Local tesseract pass, returns None so the caller falls back to Azure OCR when unsure
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            ocr_data = pytesseract.image_to_data(img, config=TESSERACT_CAPTCHA_CONFIG, output_type=Output.DICT)
+    except Exception as e:
+        logger.warning(f"Local captcha OCR unavailable, falling back to Azure: {e}")
+        return None
+
+    # The whitelist forces noise into digits, so only trust a read where every token is confident
+    tokens = [
+        (token.strip(), float(conf)) for token, conf in zip(ocr_data["text"], ocr_data["conf"]) if token.strip()
+    ]
+    if not tokens or any(conf < TESSERACT_MIN_CONFIDENCE for _, conf in tokens):
+        return None
+
+    text = " ".join(token for token, _ in tokens)
+    if _RE_CAPTCHA_EXPRESSION.match(text):
+        return text
+    return None
+
+
+def extract_text_from_image(image: bytes):
+    try:
+        read_response = client.read_in_stream(io.BytesIO(image), raw=True)
 
         operation_location = read_response.headers["Operation-Location"]
-        operation_id = operation_location.split("/")[-1]
+        operation_id = PurePosixPath(urlparse(operation_location).path).name
 
+        # Captcha images are tiny, poll quickly first and back off up to the cap
+        delay = 0.1
         while True:
             get_text_results = client.get_read_result(operation_id)
             if get_text_results.status not in [OperationStatusCodes.running, OperationStatusCodes.not_started]:
                 break
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.8)
 
         if get_text_results.status == OperationStatusCodes.succeeded:
             text = ""
@@ -258,15 +406,14 @@ def process_table(driver, table_element):
         status = row.find_element(By.XPATH, ".//td[@data-th='Status']/span").text
 
         view_link = row.find_element(By.XPATH, ".//td[@data-th='Action']/span/a")
-        time.sleep(2)
-        view_link.click()
+        WebDriverWait(driver, 10).until(EC.element_to_be_clickable(view_link)).click()
 
         element = WebDriverWait(driver, 30).until(EC.element_to_be_clickable((By.ID, "cnrResultsDetails")))
         driver.execute_script("arguments[0].click();", element)
 
         details_div = driver.find_element(By.ID, "cnrResultsDetails")
         html_content = details_div.get_attribute("outerHTML")
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, HTML_PARSER)
 
         case_details = extract_case_details(soup)
         data["details"] = {
@@ -288,43 +435,46 @@ def process_table(driver, table_element):
             "respondent_advocate": case_details.get("Respondent Advocate(s)", ""),
         }
 
+        # Expand every section first so the tables are serialized and parsed once per case
+        for table_class, content_path in CASE_DETAIL_TABLES.items():
+            expand_table(driver, table_class, content_path)
+        page_soup = get_tables_soup(driver, list(CASE_DETAIL_TABLES))
+
         logger.info("===========================================================================")
-        data["earlier_court_details"] = click_and_extract_earlier_court_details(driver)
+        data["earlier_court_details"] = extract_earlier_court_details(page_soup)
         logger.info(f"Earlier Court Details JSON:{data['earlier_court_details']}")
 
-        data["listing_date"] = extract_listing_dates(driver)
+        data["listing_date"] = extract_listing_dates(page_soup)
         logger.info(f"Extract Listing Dates JSON:{data['listing_date']}")
 
-        data["interlocutory_application_documents"] = interlocutory_application_documents(driver)
+        data["interlocutory_application_documents"] = interlocutory_application_documents(page_soup)
         logger.info(f"Interlocutory Application Documents JSON:{data['interlocutory_application_documents']}")
 
-        data["notices"] = notices(driver)
+        data["notices"] = notices(page_soup)
         logger.info(f"Notices JSON:{data['notices']}")
 
-        data["defects"] = defects(driver)
+        data["defects"] = defects(page_soup)
         logger.info(f"Defects JSON:{data['defects']}")
 
-        data["mention_memo"] = mention_memo(driver)
+        data["mention_memo"] = mention_memo(page_soup)
         logger.info(f"Mention Memo JSON:{data['mention_memo']}")
 
-        data["office_report"] = office_report(driver)
+        data["office_report"] = office_report(page_soup)
         logger.info(f"Office Report JSON:{data['office_report']}")
 
-        data["tagged_matters"] = tagged_matters(driver)
+        data["tagged_matters"] = tagged_matters(page_soup)
         logger.info(f"Tagged Matters JSON:{data['tagged_matters']}")
 
-        judgement_orders_data, merged_pdf_path, folder_pdf_paths = judgement_orders(diary_number, driver)
-        for order_item in judgement_orders_data:
-            saved_path = order_item["url"]
-            new_url = upload_pdf_to_azure(saved_path, data)
+        judgement_orders_data, pdf_files, merged_pdf = judgement_orders(diary_number, page_soup)
+        uploads = (pdf_files or []) + ([merged_pdf] if merged_pdf else [])
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            uploaded_urls = list(executor.map(lambda pdf: upload_pdf_to_azure(pdf[0], pdf[1], data), uploads))
+
+        for order_item, new_url in zip(judgement_orders_data or [], uploaded_urls):
             order_item["url"] = new_url
 
         data["judgement_orders"] = judgement_orders_data
-
-        new_merged_pdf_path = upload_pdf_to_azure(merged_pdf_path, data)
-        data["merge_pdf_url"] = new_merged_pdf_path
-
-        remove_dir(folder_pdf_paths)
+        data["merge_pdf_url"] = uploaded_urls[-1] if merged_pdf else None
 
         logger.info(f"Judgement Orders JSON:{judgement_orders_data}")
 
@@ -389,25 +539,47 @@ def extract_nested_table_data(table: BeautifulSoup):
     return data
 
 
-def extract_table_details(driver: webdriver.Chrome, table_class: str, timeout: int = 10, nested=False):
+def expand_table(
+    driver: webdriver.Chrome,
+    table_class: str,
+    content_path: str = "//tbody//table",
+    timeout: int = 10,
+    content_timeout: int = 5,
+):
     try:
         button_xpath = f"//table[contains(@class, '{table_class}')]//button"
-        table_xpath = f"//table[contains(@class, '{table_class}')]//button"
-
-        time.sleep(2)
+        # Wait on what the extractors read, wrapper rows exist in the tbody before the section loads
+        content_xpath = f"//table[contains(@class, '{table_class}')]{content_path}"
 
-        # Click the button and wait for the table to be visible
         WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, button_xpath))).click()
-        time.sleep(1)
-        WebDriverWait(driver, timeout).until(EC.visibility_of_element_located((By.XPATH, table_xpath)))
-        time.sleep(2)
+    except Exception as e:
+        logger.error(f"Error expanding table with class '{table_class}' at {driver.current_url}: {e}")
+        return False
+
+    # Wait for the loaded section content, empty sections never get any so a timeout is not an error
+    try:
+        WebDriverWait(driver, content_timeout).until(EC.presence_of_element_located((By.XPATH, content_xpath)))
+        return True
+    except TimeoutException:
+        logger.warning(f"No content loaded for table with class '{table_class}' at {driver.current_url}")
+        return False
 
-        # Extract and parse the table
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+
+def get_tables_soup(driver: webdriver.Chrome, table_classes: list):
+    # Serialize only the wanted tables instead of the whole page_source
+    fragments = []
+    for table_class in table_classes:
+        selector = "table." + ".".join(table_class.split())
+        fragments.extend(table.get_attribute("outerHTML") for table in driver.find_elements(By.CSS_SELECTOR, selector))
+    return BeautifulSoup("".join(fragments), HTML_PARSER)
+
+
+def extract_table_details(soup: BeautifulSoup, table_class: str, nested=False):
+    try:
         table = soup.find("table", class_=table_class)
 
         if not table:
-            logger.warning(f"No table found with class '{table_class}' at {driver.current_url}")
+            logger.warning(f"No table found with class '{table_class}'")
             return None
 
         if not nested:
@@ -420,68 +592,18 @@ def extract_table_details(driver: webdriver.Chrome, table_class: str, timeout: i
         return None
 
 
-def clean_header(header):
-    # Process slashes and spaces
-    header = re.sub(r"\s*/\s*", "_|_", header)
-    # Replace 'No.' variations with 'number'
-    header = re.sub(r"\bno\.?\b", "number", header, flags=re.IGNORECASE)
-    # Convert to lowercase and clean special characters
-    header = header.lower()
-    header = re.sub(r"[^a-z0-9|_ ]", "", header)
-    # Format underscores and spaces
-    header = header.replace(" ", "_")
-    header = re.sub(r"_+", "_", header)
-    header = header.strip("_")
-    return header
-
-
-def clean_headers(headers):
-    cleaned = []
-    for header in headers:
-        cleaned.append(clean_header(header))
-    return cleaned
-
-
-def process_table_data(data: dict, table_class: str):
-    if not data or "header" not in data or "rows" not in data:
-        logger.warning(f"Invalid/missing data for table: {table_class}")
-        return []
-
-    # Clean headers and handle empty/mismatch cases
-    cleaned_headers = clean_headers(data["header"]) if data["header"] else []
-    if not cleaned_headers:
-        logger.warning(f"No headers found for table: {table_class}")
-        return []
-
-    processed_rows = []
-    for row_idx, row in enumerate(data["rows"]):
-        if not row:  # Skip empty rows
-            continue
-
-        # Ensure header-cell count match
-        cells = row[: len(cleaned_headers)]  # Truncate extra cells
-        if len(cells) < len(cleaned_headers):
-            cells += [""] * (len(cleaned_headers) - len(cells))  # Pad missing cells
-
-        processed_rows.append({hdr: cell.strip() if cell else None for hdr, cell in zip(cleaned_headers, cells)})
-
-    return processed_rows
-
-
-def click_and_extract_earlier_court_details(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable earlier_court_details no-responsive", timeout)
+def extract_earlier_court_details(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable earlier_court_details no-responsive")
     return process_table_data(data=data, table_class="earlier_court_details")
 
 
-def extract_listing_dates(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable listing_dates no-responsive", timeout)
+def extract_listing_dates(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable listing_dates no-responsive")
     return process_table_data(data=data, table_class="listing_dates")
 
 
-def interlocutory_application_documents(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(
-        driver, "caseDetailsTable interlocutory_application_documents no-responsive", timeout, True
-    )
+def interlocutory_application_documents(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable interlocutory_application_documents no-responsive", True)
     if data:
         for idx, dict in enumerate(data):
             for k, v in dict.items():
@@ -490,44 +612,44 @@ def interlocutory_application_documents(driver: webdriver.Chrome, timeout: int =
     return None
 
 
-def notices(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable notices no-responsive", timeout)
+def notices(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable notices no-responsive")
     return process_table_data(data=data, table_class="notices")
 
 
-def defects(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable defects no-responsive", timeout)
+def defects(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable defects no-responsive")
     return process_table_data(data=data, table_class="defects")
 
 
-def mention_memo(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable mention_memo no-responsive", timeout)
+def mention_memo(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable mention_memo no-responsive")
     return process_table_data(data=data, table_class="mention_memo")
 
 
-def office_report(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable office_report no-responsive", timeout)
+def office_report(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable office_report no-responsive")
     return process_table_data(data=data, table_class="office_report")
 
 
-def tagged_matters(driver: webdriver.Chrome, timeout: int = 10):
-    data = extract_table_details(driver, "caseDetailsTable tagged_matters no-responsive", timeout)
+def tagged_matters(soup: BeautifulSoup):
+    data = extract_table_details(soup, "caseDetailsTable tagged_matters no-responsive")
     return process_table_data(data=data, table_class="tagged_matters")
 
 
-def download_pdf(link, folder_path):
+def download_pdf(link):
     if not link or not link.get("href"):
         return None
 
     url = link["href"]
-    pdf_name = uuid.uuid4().hex + url.split("/")[-1]
-    pdf_path = os.path.join(folder_path, pdf_name)
+    pdf_name = uuid.uuid4().hex + PurePosixPath(urlparse(url).path).name
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        with open(pdf_path, "wb") as f:
-            f.write(response.content)
-        return pdf_path
+        buffer = io.BytesIO()
+        with http_session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, buffer, length=65536)
+        return pdf_name, buffer.getvalue()
     except Exception as e:
         logger.error(f"Could not download pdf '{pdf_name}': {e}")
         return None
@@ -541,110 +663,161 @@ def extract_date_from_filename(filename):
         return datetime.min
 
 
-def merge_pdfs(pdf_files, output_path):
-    pdf_writer = PyPDF2.PdfWriter()
-    for pdf in pdf_files:
-        try:
-            pdf_reader = PyPDF2.PdfReader(pdf)
-            for page in pdf_reader.pages:
-                pdf_writer.add_page(page)
-        except Exception as e:
-            logger.error(f"Error reading PDF {pdf}: {e}")
-    with open(output_path, "wb") as merged_pdf:
-        pdf_writer.write(merged_pdf)
+def merge_pdfs(pdf_files):
+    output = io.BytesIO()
+    with pikepdf.Pdf.new() as merged_pdf:
+        for pdf_name, content in pdf_files:
+            try:
+                with pikepdf.open(io.BytesIO(content)) as src:
+                    merged_pdf.pages.extend(src.pages)
+            except Exception as e:
+                logger.error(f"Error reading PDF {pdf_name}: {e}")
+        merged_pdf.save(output)
+    return output.getvalue()
 
 
-def judgement_orders(diary_number: str, driver: webdriver.Chrome, timeout: int = 10):
+def judgement_orders(diary_number: str, soup: BeautifulSoup):
     try:
         selector = "caseDetailsTable judgement_orders no-responsive"
-
-        button_xpath = f"//table[contains(@class, '{selector}')]//button"
-        table_xpath = f"//table[contains(@class, '{selector}')]//button"
-
-        WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, button_xpath))).click()
-        time.sleep(2)
-        WebDriverWait(driver, timeout).until(EC.visibility_of_element_located((By.XPATH, table_xpath)))
-
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        table = soup.find("table", class_="caseDetailsTable judgement_orders no-responsive")
+        table = soup.find("table", class_=selector)
 
         if not table:
-            logger.warning(f"No table found with class '{selector}' at {driver.current_url}")
+            logger.warning(f"No table found with class '{selector}' for diary number {diary_number}")
             return None, None, None
 
-        # Downloading order pdfs
-        folder_name = diary_number.replace("/", "_")
-        folder_path = os.path.join("case_pdfs", folder_name)
-        os.makedirs(folder_path, exist_ok=True)
-
+        # Downloading order pdfs, kept in memory as (name, bytes) pairs
         links = [row.find("a") for row in table.find("tbody").find_all("tr")]
 
         with ThreadPoolExecutor(max_workers=5) as executor:
-            pdf_files = list(filter(None, executor.map(lambda link: download_pdf(link, folder_path), links)))
+            pdf_files = list(filter(None, executor.map(download_pdf, links)))
 
         if not pdf_files:
-            logger.warning(f"No pdf files found at {driver.current_url}")
-            return [], None, folder_path
+            logger.warning(f"No pdf files found for diary number {diary_number}")
+            return [], [], None
 
-        pdf_files.sort(key=lambda x: extract_date_from_filename(x))
-        merged_pdf_path = os.path.join(folder_path, f"{folder_name}_merged_pdf.pdf")
-        merge_pdfs(pdf_files, merged_pdf_path)
+        pdf_files.sort(key=lambda pdf: extract_date_from_filename(pdf[0]))
+        merged_pdf_name = f"{diary_number.replace('/', '_')}_merged_pdf.pdf"
+        merged_pdf = (merged_pdf_name, merge_pdfs(pdf_files))
 
         table_data = [
-            {"order_date": datetime.strftime(extract_date_from_filename(pdf), "%d/%m/%Y"), "url": pdf}
-            for pdf in pdf_files
+            {"order_date": datetime.strftime(extract_date_from_filename(pdf_name), "%d/%m/%Y"), "url": pdf_name}
+            for pdf_name, _ in pdf_files
         ]
 
-        return table_data, merged_pdf_path, folder_path
+        return table_data, pdf_files, merged_pdf
 
     except Exception as e:
         logger.error(f"Error extracting earlier court details: {e}")
-        return None, None
+        return None, None, None
 
 
-def upload_pdf_to_azure(file_path, details):
+def upload_pdf_to_azure(blob_name, content, details):
     try:
-        blob_name = file_path.split("/")[-1]
-        blob_service_client = BlobServiceClient.from_connection_string(os.getenv("AZURE_CONNECTION_STRING"))
-        blob_client = blob_service_client.get_blob_client(container=os.getenv("AZURE_CONTAINER_NAME"), blob=blob_name)
-        if blob_client.exists():
-            blob_client.delete_blob()
-        with open(file_path, "rb") as data:
-            blob_client.upload_blob(data, overwrite=True)
+        blob_client = container_client.get_blob_client(blob_name)
+        blob_client.upload_blob(content, overwrite=True)
         return blob_client.url
     except Exception as e:
-        logger.error(f"Error while uploading {file_path} of case {details} to azure: {e}")
+        logger.error(f"Error while uploading {blob_name} of case {details} to azure: {e}")
         return None
 
 
-def remove_dir(dir_path):
-    if os.path.exists(dir_path):
-        shutil.rmtree(dir_path)
+def insert_batch(batch):
+    try:
+        collection.insert_many(batch, ordered=False)
+    except Exception as e:
+        # Put the batch back so the next save or the exit flush retries it instead of dropping the cases
+        logger.error(f"Error inserting {len(batch)} cases into mongodb, keeping them buffered: {e}")
+        with _mongo_buffer_lock:
+            _mongo_buffer[:0] = batch
 
 
 def save_to_mongodb(data):
-    collection.insert_one(data)
-
-
-if __name__ == "__main__":
-    from_year = 2025
-
-    while from_year >= 2020:
-        current_diary_number = 1
-        continuous_empty_case = 0
-
-        while True:
-            op = process_case_details_by_diary_number(str(current_diary_number), str(from_year))
+    with _mongo_buffer_lock:
+        _mongo_buffer.append(data)
+        if len(_mongo_buffer) < MONGO_BATCH_SIZE:
+            return
+        batch = _mongo_buffer[:]
+        _mongo_buffer.clear()
+    insert_batch(batch)
+
+
+def flush_mongodb():
+    with _mongo_buffer_lock:
+        batch = _mongo_buffer[:]
+        _mongo_buffer.clear()
+    if batch:
+        insert_batch(batch)
+
+
+atexit.register(flush_mongodb)
+
+
+def crawl_year(year: int, executor: ThreadPoolExecutor):
+    next_diary_number = 1
+    next_result_number = 1
+    continuous_empty_case = 0
+    continuous_failed_case = 0
+    in_flight = {}
+    results = {}
+    retries = {}
+
+    def submit(diary_number: int):
+        future = executor.submit(process_case_details_by_diary_number, str(diary_number), str(year))
+        in_flight[future] = diary_number
+
+    def submit_next():
+        nonlocal next_diary_number
+        submit(next_diary_number)
+        next_diary_number += 1
+
+    while next_diary_number - next_result_number < MAX_IN_FLIGHT:
+        submit_next()
+
+    while continuous_empty_case < 10:
+        done, _ = wait_futures(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            diary_number = in_flight.pop(future)
+            try:
+                op = future.result()
+            except Exception as e:
+                logger.error(f"Error processing diary number {diary_number}/{year}: {e}")
+                op = None
+
+            # None is a scrape failure (driver, network, captcha), not a missing diary number, so retry it
+            if op is None and retries.get(diary_number, 0) < MAX_CASE_RETRIES:
+                retries[diary_number] = retries.get(diary_number, 0) + 1
+                logger.warning(f"Retrying diary number {diary_number}/{year}, attempt {retries[diary_number]}")
+                submit(diary_number)
+                continue
+            results[diary_number] = op
+
+        # Consume results in diary number order so the empty case count matches the sequential crawl
+        while next_result_number in results and continuous_empty_case < 10:
+            op = results.pop(next_result_number)
+            if op is None:
+                logger.error(f"Skipping diary number {next_result_number}/{year} after {MAX_CASE_RETRIES} retries")
+                continuous_failed_case += 1
+                # Every case failing means the scraper itself is broken, surface it instead of crawling forever
+                if continuous_failed_case == 10:
+                    raise Exception(f"10 consecutive diary numbers failed for year {year}, stopping crawl")
+            else:
+                continuous_failed_case = 0
+                if op:
+                    op["year"] = year
+                    save_to_mongodb(op)
+                else:
+                    continuous_empty_case += 1
+            next_result_number += 1
 
-            if continuous_empty_case == 10:
-                break
+        if continuous_empty_case < 10:
+            while next_diary_number - next_result_number < MAX_IN_FLIGHT:
+                submit_next()
 
-            if op:
-                op["year"] = from_year
-                save_to_mongodb(op)
-            else:
-                continuous_empty_case += 1
+    for future in in_flight:
+        future.cancel()
 
-            current_diary_number += 1
 
-        from_year -= 1
+if __name__ == "__main__":
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for from_year in range(2025, 2019, -1):
+            crawl_year(from_year, executor)
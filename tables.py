@@ -0,0 +1,59 @@
+# Pure python table helpers kept free of selenium/bs4 so the module can be compiled with mypyc:
+#   pip install mypy && mypyc tables.py
+# main.py imports the compiled extension when it is present, the plain module otherwise.
+import logging
+import re
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("supremecourt")
+
+# Header cleanup patterns used by clean_header
+_RE_SLASH = re.compile(r"\s*/\s*")
+_RE_NO = re.compile(r"\bno\.?\b", re.IGNORECASE)
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9|_ ]")
+_RE_UNDER = re.compile(r"_+")
+
+
+def clean_header(header: str) -> str:
+    # Process slashes and spaces
+    header = _RE_SLASH.sub("_|_", header)
+    # Replace 'No.' variations with 'number'
+    header = _RE_NO.sub("number", header)
+    # Convert to lowercase and clean special characters
+    header = header.lower()
+    header = _RE_NON_ALNUM.sub("", header)
+    # Format underscores and spaces
+    header = header.replace(" ", "_")
+    header = _RE_UNDER.sub("_", header)
+    header = header.strip("_")
+    return header
+
+
+def clean_headers(headers: List[str]) -> List[str]:
+    return [clean_header(header) for header in headers]
+
+
+def process_table_data(data: Optional[dict], table_class: str) -> List[Dict[str, Optional[str]]]:
+    if not data or "header" not in data or "rows" not in data:
+        logger.warning(f"Invalid/missing data for table: {table_class}")
+        return []
+
+    # Clean headers and handle empty/mismatch cases
+    cleaned_headers = clean_headers(data["header"]) if data["header"] else []
+    if not cleaned_headers:
+        logger.warning(f"No headers found for table: {table_class}")
+        return []
+
+    processed_rows: List[Dict[str, Optional[str]]] = []
+    for row in data["rows"]:
+        if not row:  # Skip empty rows
+            continue
+
+        # Ensure header-cell count match
+        cells: List[str] = row[: len(cleaned_headers)]  # Truncate extra cells
+        if len(cells) < len(cleaned_headers):
+            cells += [""] * (len(cleaned_headers) - len(cells))  # Pad missing cells
+
+        processed_rows.append({hdr: cell.strip() if cell else None for hdr, cell in zip(cleaned_headers, cells)})
+
+    return processed_rows